@@ -0,0 +1,11 @@
+import multiprocessing
+import os
+
+# Gunicorn picks this file up automatically: `gunicorn app:app`
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# The app only serves a static page, so requests are I/O-bound. Threaded
+# workers keep slow clients from tying up a whole process each.
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+threads = int(os.environ.get('GUNICORN_THREADS', 8))